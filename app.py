@@ -1,7 +1,6 @@
 import streamlit as st
 from utils.io import load_data, get_data_info
-from utils.prep import clean_data
-from sections import intro, data_quality, overview
+from utils.prep import clean_data, make_tables, get_data_quality_report
 
 st.set_page_config(
     page_title="Student Depression Dashboard",
@@ -9,16 +8,60 @@ st.set_page_config(
     page_icon="🧠"
 )
 
+@st.cache_resource(show_spinner=False)
+def load_and_prepare_data():
+    """
+    Load, clean and aggregate the dataset once instead of on every rerun
+    
+    Cached as a shared resource: every session receives the same objects
+    without a pickle round-trip, so sections must treat them as read-only
+    (copy before modifying).
+    
+    Returns:
+        tuple: (Raw DataFrame, Cleaned DataFrame, list of removed columns,
+                dict of renamed columns, dict of cleaning stats, dict of aggregate tables,
+                dict of data quality statistics)
+    """
+    df_raw = load_data()
+    df_clean, removed_cols, col_mapping, cleaning_stats = clean_data(df_raw)
+    tables = make_tables(df_clean)
+    quality_report = get_data_quality_report(df_raw, df_clean)
+    
+    return df_raw, df_clean, removed_cols, col_mapping, cleaning_stats, tables, quality_report
+
 # Load data
-df_raw = load_data()
-df_clean, removed_cols, col_mapping, cleaning_stats = clean_data(df_raw)
+(df_raw, df_clean, removed_cols, col_mapping,
+ cleaning_stats, tables, quality_report) = load_and_prepare_data()
+
+# Section renderers
+# Sections are imported on demand so only the visible one (and its Plotly
+# dependencies) is loaded
+def show_intro():
+    from sections import intro
+    intro.show()
+
+def show_data_quality():
+    from sections import data_quality
+    data_quality.show(df_raw, removed_cols, col_mapping, cleaning_stats, quality_report)
+
+def show_overview():
+    from sections import overview
+    overview.show(tables)
+
+SECTIONS = {
+    "Introduction": show_intro,
+    "Data Quality": show_data_quality,
+    "Overview": show_overview,
+    "Deep Dive": lambda: st.info("Deep Dive section - Coming soon!"),
+    "Conclusions": lambda: st.info("Conclusions section - Coming soon!")
+}
 
 # Sidebar
 with st.sidebar:
     st.header("🎯 Navigation")
     section = st.radio(
         "Select Section:",
-        ["Introduction", "Data Quality", "Overview", "Deep Dive", "Conclusions"]
+        list(SECTIONS)
     )
 
 # Main title
@@ -27,13 +70,4 @@ st.caption("Understanding Mental Health Patterns in Student Populations")
 st.markdown("---")
 
 # Display selected section
-if section == "Introduction":
-    intro.show()
-elif section == "Data Quality":
-    data_quality.show(df_raw, df_clean, removed_cols, col_mapping, cleaning_stats)
-elif section == "Overview":
-    overview.show(df_clean)
-elif section == "Deep Dive":
-    st.info("Deep Dive section - Coming soon!")
-elif section == "Conclusions":
-    st.info("Conclusions section - Coming soon!")
\ No newline at end of file
+SECTIONS[section]()
\ No newline at end of file
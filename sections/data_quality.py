@@ -1,45 +1,6 @@
 import pandas as pd
 import streamlit as st
 
-def check_missing_values(df):
-    """
-    Check for missing values in the dataset
-    
-    Args:
-        df: DataFrame
-        
-    Returns:
-        pd.DataFrame: Missing values summary
-    """
-    missing = df.isnull().sum()
-    missing_pct = (missing / len(df)) * 100
-    
-    missing_df = pd.DataFrame({
-        'Column': missing.index,
-        'Missing_Count': missing.values,
-        'Missing_Percentage': missing_pct.values
-    })
-    
-    # Only show columns with missing values
-    missing_df = missing_df[missing_df['Missing_Count'] > 0]
-    
-    return missing_df
-
-
-def check_duplicates(df):
-    """
-    Check for duplicate rows
-    
-    Args:
-        df: DataFrame
-        
-    Returns:
-        int: Number of duplicate rows
-    """
-    duplicates = df.duplicated().sum()
-    return duplicates
-
-
 def get_column_descriptions():
     """
     Return descriptions of all columns in the dataset
@@ -70,68 +31,21 @@ def get_column_descriptions():
     return descriptions
 
 
-def validate_numeric_ranges(df):
-    """
-    Validate that numeric columns are within expected ranges
-    
-    Args:
-        df: DataFrame
-        
-    Returns:
-        dict: Validation results
-    """
-    validations = {}
-    
-    # Age: should be reasonable for students
-    if 'Age' in df.columns:
-        validations['age'] = {
-            'min': df['Age'].min(),
-            'max': df['Age'].max(),
-            'valid': (df['Age'] >= 18).all() and (df['Age'] <= 100).all()
-        }
-    
-    # CGPA: should be between 0-10
-    if 'CGPA' in df.columns:
-        validations['cgpa'] = {
-            'min': df['CGPA'].min(),
-            'max': df['CGPA'].max(),
-            'valid': (df['CGPA'] >= 0).all() and (df['CGPA'] <= 10).all()
-        }
-    
-    # Pressure scores: should be between 0-5
-    if 'Academic_Pressure' in df.columns:
-        validations['academic_pressure'] = {
-            'min': df['Academic_Pressure'].min(),
-            'max': df['Academic_Pressure'].max(),
-            'valid': (df['Academic_Pressure'] >= 0).all() and (df['Academic_Pressure'] <= 5).all()
-        }
-    
-    return validations
-
-
-def show_column_info(df):
+def show_column_info(column_info):
     """
     Display detailed information about each column
     
     Args:
-        df: DataFrame
+        column_info: Precomputed column metadata (name, type, counts)
     """
     st.markdown("### 📋 Dataset Columns Information")
     
     descriptions = get_column_descriptions()
     
-    # Create DataFrame with column info
-    col_info = []
-    for col in df.columns:
-        col_info.append({
-            'Column Name': col,
-            'Data Type': str(df[col].dtype),
-            'Non-Null Count': df[col].notna().sum(),
-            'Unique Values': df[col].nunique(),
-            'Description': descriptions.get(col, 'No description available')
-        })
-    
-    col_df = pd.DataFrame(col_info)
+    # Add descriptions without touching the shared cached frame
+    col_df = column_info.assign(
+        Description=column_info['Column Name'].map(descriptions).fillna('No description available')
+    )
     st.dataframe(col_df, use_container_width=True, hide_index=True)
 
 
@@ -147,6 +61,8 @@ def show_cleaning_summary(removed_columns, column_mapping, cleaning_stats, df_ra
     """
     st.markdown("### 🧹 Data Cleaning Process")
     
+    n_raw = len(df_raw)
+    
     st.markdown("""
     The following cleaning steps were applied to ensure data quality and follow best practices:
     """)
@@ -176,8 +92,8 @@ def show_cleaning_summary(removed_columns, column_mapping, cleaning_stats, df_ra
     rows_removed_missing = cleaning_stats.get('rows_removed_missing', 0)
     if rows_removed_missing > 0:
         st.write(f"- **Action**: Removed **{rows_removed_missing} rows** with missing values")
-        st.write(f"- **Reason**: Only {rows_removed_missing} missing values ({rows_removed_missing/len(df_raw)*100:.3f}%) - minimal impact on dataset")
-        st.write(f"- **Column affected**: Financial_Stress")
+        st.write(f"- **Reason**: Only {rows_removed_missing} missing values ({rows_removed_missing/n_raw*100:.3f}%) - minimal impact on dataset")
+        st.write(f"- **Column(s) affected**: {', '.join(cleaning_stats.get('missing_columns', []))}")
     else:
         st.success("✅ No missing values found")
     
@@ -190,7 +106,7 @@ def show_cleaning_summary(removed_columns, column_mapping, cleaning_stats, df_ra
     
     if cities_removed > 0:
         st.warning(f"**Removed {cities_removed} cities** with fewer than {min_threshold} students")
-        st.write(f"- **Rows affected**: {rows_removed_city:,} students removed ({rows_removed_city/len(df_raw)*100:.2f}% of dataset)")
+        st.write(f"- **Rows affected**: {rows_removed_city:,} students removed ({rows_removed_city/n_raw*100:.2f}% of dataset)")
         st.write(f"- **Threshold**: Minimum {min_threshold} students per city")
         
         st.write(f"""
@@ -214,16 +130,15 @@ def show_cleaning_summary(removed_columns, column_mapping, cleaning_stats, df_ra
     if removed_columns:
         st.warning(f"**Removed {len(removed_columns)} column(s)** that contain only constant values:")
         
+        # Map new names back to raw names once instead of scanning per column
+        original_names = {new_name: old_name for old_name, new_name in column_mapping.items()}
+        
         for col in removed_columns:
             # Check if column exists in raw data with old name
-            original_col = col
-            for old_name, new_name in column_mapping.items():
-                if new_name == col and old_name in df_raw.columns:
-                    original_col = old_name
-                    break
+            original_col = original_names.get(col, col)
             
             if original_col in df_raw.columns:
-                unique_val = df_raw[original_col].unique()[0]
+                unique_val = df_raw[original_col].iat[0]
             else:
                 unique_val = "N/A"
             
@@ -242,35 +157,33 @@ def show_cleaning_summary(removed_columns, column_mapping, cleaning_stats, df_ra
     st.markdown("#### 4️⃣ Data Type Verification")
     st.write("""
     - **Depression**: Ensured integer type (0 or 1) for binary classification
-    - **Numeric columns**: Validated ranges (Age, CGPA, Pressure scores)
-    - **Categorical columns**: Preserved as strings (Gender, City, Degree, etc.)
+    - **Numeric columns**: Validated ranges (Age, CGPA, Pressure scores), stored as `float32`
+    - **Categorical columns**: Stored as `category` (Gender, City, Degree, Sleep_Duration, etc.)
     """)
 
 
-def show(df_raw, df_clean, removed_columns, column_mapping, cleaning_stats):
+def show(df_raw, removed_columns, column_mapping, cleaning_stats, quality_report):
     """
     Display complete data quality section
     
     Args:
         df_raw: Original DataFrame
-        df_clean: Cleaned DataFrame
         removed_columns: List of removed column names
         column_mapping: Dictionary of renamed columns
         cleaning_stats: Dictionary with cleaning statistics
+        quality_report: Precomputed quality statistics (see utils.prep.get_data_quality_report)
     """
     st.markdown("## 📊 Data Quality & Validation")
     
     # Overview metrics
     col1, col2, col3, col4 = st.columns(4)
     
-    missing_count = df_raw.isnull().sum().sum()
-    missing_pct = (missing_count / (len(df_raw) * len(df_raw.columns))) * 100
-    duplicates = check_duplicates(df_raw)
-    total_removed = len(df_raw) - len(df_clean)
+    missing_count = quality_report['missing_count']
+    total_removed = cleaning_stats['rows_removed_total']
     
-    col1.metric("Original Records", f"{len(df_raw):,}")
-    col2.metric("Final Records", f"{len(df_clean):,}")
-    col3.metric("Records Removed", f"{total_removed:,}", delta=f"-{total_removed/len(df_raw)*100:.1f}%")
+    col1.metric("Original Records", f"{cleaning_stats['rows_original']:,}")
+    col2.metric("Final Records", f"{cleaning_stats['rows_final']:,}")
+    col3.metric("Records Removed", f"{total_removed:,}", delta=f"-{total_removed/cleaning_stats['rows_original']*100:.1f}%")
     col4.metric("Columns Renamed", len(column_mapping))
     
     st.markdown("---")
@@ -281,21 +194,21 @@ def show(df_raw, df_clean, removed_columns, column_mapping, cleaning_stats):
     st.markdown("---")
     
     # Column information
-    show_column_info(df_clean)
+    show_column_info(quality_report['column_info'])
     
     st.markdown("---")
     
     # Missing values details (if any)
     if missing_count > 0:
         st.markdown("### 🔍 Missing Values Details")
-        missing_df = check_missing_values(df_raw)
+        missing_df = quality_report['missing_table']
         st.dataframe(missing_df, use_container_width=True, hide_index=True)
     
     st.markdown("---")
     
     # Validation checks
     st.markdown("### ✅ Data Validation Checks")
-    validations = validate_numeric_ranges(df_clean)
+    validations = quality_report['validations']
     
     all_valid = all(v['valid'] for v in validations.values())
     
@@ -1,24 +1,23 @@
 import streamlit as st
-from utils.prep import get_city_stats, get_demographic_stats, get_sleep_stats
 from utils.viz import create_city_map, create_demographic_chart, create_sleep_chart
 
-def show(df):
+def show(tables):
     """
     Display overview section with KPIs and high-level visualizations
     
     Args:
-        df: Cleaned DataFrame
+        tables: Precomputed aggregate tables (see utils.prep.make_tables)
     """
     st.markdown("## 📈 Overview: Key Statistics")
     
-    # Calculate overall statistics
-    total_students = len(df)
-    depressed_students = df['Depression'].sum()
-    depression_rate = (depressed_students / total_students) * 100
+    # Overall statistics (precomputed once at load)
+    summary = tables['summary']
+    total_students = summary['total_students']
+    depressed_students = summary['depressed_students']
+    depression_rate = summary['depression_rate']
     
-    avg_age = df['Age'].mean()
-    avg_cgpa = df['CGPA'].mean()
-    avg_academic_pressure = df['Academic_Pressure'].mean()
+    avg_cgpa = summary['avg_cgpa']
+    avg_academic_pressure = summary['avg_academic_pressure']
     
     # KPI Header
     st.markdown("### 🎯 Key Metrics")
@@ -67,17 +66,16 @@ def show(df):
     
     with col_insight2:
         # Depression breakdown
-        depression_breakdown = df['Depression'].value_counts()
         st.write("**Depression Status:**")
-        st.write(f"✅ Not Depressed: {depression_breakdown.get(0, 0):,}")
-        st.write(f"❌ Depressed: {depression_breakdown.get(1, 0):,}")
+        st.write(f"✅ Not Depressed: {summary['not_depressed_students']:,}")
+        st.write(f"❌ Depressed: {depressed_students:,}")
     
     st.markdown("---")
     
 # Geographic distribution
     st.markdown("### 🗺️ Geographic Distribution")
     
-    city_stats = get_city_stats(df, min_students=1)  # All remaining cities (already filtered in cleaning)
+    city_stats = tables['city']  # All remaining cities (already filtered in cleaning)
     
     total_cities = len(city_stats)
     
@@ -89,7 +87,7 @@ def show(df):
     
     # Full width chart
     fig_city = create_city_map(city_stats)
-    st.plotly_chart(fig_city, use_container_width=True)
+    st.plotly_chart(fig_city, use_container_width=True, key="overview_city")
     
     # Expandable table
     with st.expander(f"🔍 View all {total_cities} cities in analysis"):
@@ -101,10 +99,9 @@ def show(df):
     
     # Data quality note for cities
     with st.expander("🔍 View all cities and student counts"):
-        all_cities = df['City'].value_counts().reset_index()
-        all_cities.columns = ['City', 'Student_Count']
-        all_cities['Depression_Rate'] = all_cities['City'].map(
-            df.groupby('City')['Depression'].mean() * 100
+        # Same per-city counts and rates as city_stats, ordered by size
+        all_cities = city_stats[['City', 'Total_Students', 'Depression_Rate']].rename(
+            columns={'Total_Students': 'Student_Count'}
         )
         all_cities = all_cities.sort_values('Student_Count', ascending=False)
         
@@ -113,14 +110,14 @@ def show(df):
     # Demographics
     st.markdown("### 👥 Demographic Analysis")
     
-    demo_stats = get_demographic_stats(df)
+    demo_stats = tables['demographics']
     
     col_demo1, col_demo2 = st.columns(2)
     
     with col_demo1:
         st.markdown("#### Gender Comparison")
         fig_gender = create_demographic_chart(demo_stats, 'gender')
-        st.plotly_chart(fig_gender, use_container_width=True)
+        st.plotly_chart(fig_gender, use_container_width=True, key="overview_gender")
         
         # Gender insight
         gender_data = demo_stats['gender']
@@ -131,7 +128,7 @@ def show(df):
     with col_demo2:
         st.markdown("#### Education Level Comparison")
         fig_degree = create_demographic_chart(demo_stats, 'degree')
-        st.plotly_chart(fig_degree, use_container_width=True)
+        st.plotly_chart(fig_degree, use_container_width=True, key="overview_degree")
         
         # Degree insight with explanation
         degree_data = demo_stats['degree']
@@ -157,13 +154,13 @@ def show(df):
     # Sleep analysis
     st.markdown("### 😴 Sleep Duration & Depression")
     
-    sleep_stats = get_sleep_stats(df)
+    sleep_stats = tables['sleep']
     
     col_sleep1, col_sleep2 = st.columns([3, 1])
     
     with col_sleep1:
         fig_sleep = create_sleep_chart(sleep_stats)
-        st.plotly_chart(fig_sleep, use_container_width=True)
+        st.plotly_chart(fig_sleep, use_container_width=True, key="overview_sleep")
     
     with col_sleep2:
         st.markdown("**Depression Rate by Sleep:**")
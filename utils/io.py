@@ -1,15 +1,71 @@
+import os
+import tempfile
+
 import pandas as pd
-import streamlit as st
 
-@st.cache_data
+CSV_PATH = 'data/Student Depression Dataset.csv'
+PARQUET_PATH = 'data/Student Depression Dataset.parquet'
+
+# Explicit column types so the CSV parser skips dtype inference
+CSV_DTYPES = {
+    'id': 'int64',
+    'Gender': 'object',
+    'Age': 'float64',
+    'City': 'object',
+    'Profession': 'object',
+    'Academic Pressure': 'float64',
+    'Work Pressure': 'float64',
+    'CGPA': 'float64',
+    'Study Satisfaction': 'float64',
+    'Job Satisfaction': 'float64',
+    'Sleep Duration': 'object',
+    'Dietary Habits': 'object',
+    'Degree': 'object',
+    'Have you ever had suicidal thoughts ?': 'object',
+    'Work/Study Hours': 'float64',
+    'Financial Stress': 'float64',
+    'Family History of Mental Illness': 'object',
+    'Depression': 'int64'
+}
+
 def load_data():
     """
     Load the Student Depression Dataset
     
+    The CSV is parsed once and saved as a Parquet file next to it,
+    so later cold starts read typed columns instead of re-parsing text.
+    The Parquet copy is only used while it is newer than the CSV and
+    readable; otherwise it is rebuilt from the CSV.
+    Not cached itself: the only caller, load_and_prepare_data in app.py,
+    already is.
+    
     Returns:
         pd.DataFrame: Raw dataset
     """
-    df = pd.read_csv('data/Student Depression Dataset.csv')
+    if (os.path.exists(PARQUET_PATH)
+            and os.path.getmtime(PARQUET_PATH) >= os.path.getmtime(CSV_PATH)):
+        try:
+            return pd.read_parquet(PARQUET_PATH)
+        except (OSError, ValueError):
+            # Unreadable sidecar (e.g. truncated): re-parse the CSV below,
+            # which also rewrites it
+            pass
+    
+    df = pd.read_csv(CSV_PATH, dtype=CSV_DTYPES, engine='pyarrow')
+    
+    # Write to a temporary file and move it into place, so an interrupted
+    # or concurrent write never leaves a partial sidecar behind
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(PARQUET_PATH), suffix='.parquet')
+        os.close(fd)
+        df.to_parquet(tmp_path, compression='zstd', index=False)
+        os.replace(tmp_path, PARQUET_PATH)
+    except OSError:
+        # Read-only deployments keep parsing the CSV
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
     return df
 
 def get_data_info(df):
@@ -1,5 +1,14 @@
 import pandas as pd
 
+# Demographic breakdowns shown in the Overview (stats key -> column)
+DEMOGRAPHIC_COLUMNS = {
+    'gender': 'Gender',
+    'degree': 'Degree'
+}
+
+# Natural order of the Sleep_Duration answers ('Others' is excluded from charts)
+SLEEP_ORDER = ['Less than 5 hours', '5-6 hours', '7-8 hours', 'More than 8 hours', 'Others']
+
 def clean_data(df):
     """
     Clean the dataset by:
@@ -7,7 +16,7 @@ def clean_data(df):
     - Removing missing values
     - Removing cities with too few students (<20) for statistical validity
     - Removing constant/useless columns
-    - Preparing data types
+    - Preparing data types (low-cardinality labels stored as categories)
     
     Args:
         df: Raw DataFrame
@@ -33,26 +42,48 @@ def clean_data(df):
     
     # Step 2: Remove rows with missing values (only 3, so it's safe)
     rows_before_missing = len(df_clean)
+    missing_columns = df_clean.columns[df_clean.isnull().any()].tolist()
     df_clean = df_clean.dropna()
     rows_after_missing = len(df_clean)
     
     # Step 3: Remove cities with fewer than 20 students
     MIN_STUDENTS_PER_CITY = 20
     
-    city_counts = df_clean['City'].value_counts()
-    valid_cities = city_counts[city_counts >= MIN_STUDENTS_PER_CITY].index
+    # Each row's city size from one groupby, used directly as the row mask
+    city_sizes = df_clean.groupby('City', sort=False)['City'].transform('size')
+    keep_rows = city_sizes >= MIN_STUDENTS_PER_CITY
     
     rows_before_city_filter = len(df_clean)
-    df_clean = df_clean[df_clean['City'].isin(valid_cities)]
+    removed_city_count = df_clean.loc[~keep_rows, 'City'].nunique()
+    df_clean = df_clean[keep_rows]
     rows_after_city_filter = len(df_clean)
     
-    removed_city_count = len(city_counts) - len(valid_cities)
     rows_removed_by_city = rows_before_city_filter - rows_after_city_filter
     
     # Step 4: Ensure Depression is integer type
     df_clean['Depression'] = df_clean['Depression'].astype(int)
     
-    # Step 5: Remove useless columns (constant values)
+    # Scores and ages are small-range values, float32 is precise enough
+    float_cols = df_clean.select_dtypes(include='float64').columns
+    df_clean[float_cols] = df_clean[float_cols].astype('float32')
+    
+    # Step 5: Store label columns as categories (all are low-cardinality)
+    label_cols = df_clean.select_dtypes(include='object').columns
+    
+    for col in label_cols:
+        df_clean[col] = df_clean[col].astype('category')
+    
+    # Sleep durations are ordinal: keep their natural order in the dtype.
+    # Only the observed labels are reordered, so an unexpected label is kept
+    # (after the known ones) instead of silently becoming NaN
+    sleep_labels = df_clean['Sleep_Duration'].cat.categories
+    sleep_order = [label for label in SLEEP_ORDER if label in sleep_labels]
+    sleep_order += [label for label in sleep_labels if label not in SLEEP_ORDER]
+    df_clean['Sleep_Duration'] = df_clean['Sleep_Duration'].cat.reorder_categories(
+        sleep_order, ordered=True
+    )
+    
+    # Step 6: Remove useless columns (constant values)
     columns_to_remove = []
     
     # Check for columns with only one unique value
@@ -65,7 +96,11 @@ def clean_data(df):
     
     # Store cleaning stats
     cleaning_stats = {
+        'rows_original': rows_before_missing,
+        'rows_final': len(df_clean),
+        'rows_removed_total': rows_before_missing - len(df_clean),
         'rows_removed_missing': rows_before_missing - rows_after_missing,
+        'missing_columns': missing_columns,
         'rows_removed_city': rows_removed_by_city,
         'cities_removed': removed_city_count,
         'min_students_threshold': MIN_STUDENTS_PER_CITY
@@ -94,6 +129,83 @@ def get_column_info(df):
     return constant_cols
 
 
+def validate_numeric_ranges(df):
+    """
+    Validate that numeric columns are within expected ranges
+    
+    Args:
+        df: DataFrame
+        
+    Returns:
+        dict: Validation results
+    """
+    # Column: (result key, lower bound, upper bound)
+    expected_ranges = {
+        'Age': ('age', 18, 100),                           # reasonable for students
+        'CGPA': ('cgpa', 0, 10),                           # between 0-10
+        'Academic_Pressure': ('academic_pressure', 0, 5)   # between 0-5
+    }
+    
+    cols = [col for col in expected_ranges if col in df.columns]
+    
+    # Single min/max pass; a column is in range iff its extremes are
+    extremes = df[cols].agg(['min', 'max'])
+    
+    validations = {}
+    for col in cols:
+        key, lower, upper = expected_ranges[col]
+        col_min = extremes.loc['min', col]
+        col_max = extremes.loc['max', col]
+        validations[key] = {
+            'min': col_min,
+            'max': col_max,
+            'valid': lower <= col_min and col_max <= upper
+        }
+    
+    return validations
+
+
+def get_data_quality_report(df, df_clean):
+    """
+    Compute the statistics shown in the Data Quality section
+    
+    Args:
+        df: Raw DataFrame
+        df_clean: Cleaned DataFrame
+        
+    Returns:
+        dict: Missing value summary, cleaned column metadata and
+              numeric range validations
+    """
+    # One vectorized pass over the whole frame
+    missing = df.isnull().sum()
+    
+    # Only show columns with missing values
+    missing_cols = missing[missing > 0]
+    
+    missing_df = pd.DataFrame({
+        'Column': missing_cols.index,
+        'Missing_Count': missing_cols.values,
+        'Missing_Percentage': missing_cols.values / len(df) * 100
+    })
+    
+    report = {
+        'missing_count': int(missing_cols.sum()),
+        'missing_table': missing_df
+    }
+    
+    # Column metadata for the cleaned dataset (one frame-wide call per statistic)
+    report['column_info'] = pd.DataFrame({
+        'Column Name': df_clean.columns,
+        'Data Type': df_clean.dtypes.astype(str).values,
+        'Non-Null Count': df_clean.count().values,
+        'Unique Values': df_clean.nunique().values
+    })
+    report['validations'] = validate_numeric_ranges(df_clean)
+    
+    return report
+
+
 def get_city_stats(df, min_students=1):
     """
     Calculate depression statistics by city
@@ -105,15 +217,22 @@ def get_city_stats(df, min_students=1):
     Returns:
         pd.DataFrame: City-level statistics (filtered if min_students > 1)
     """
-    city_stats = df.groupby('City').agg({
-        'Depression': ['sum', 'count', 'mean'],
-        'Academic_Pressure': 'mean',
-        'Sleep_Duration': lambda x: x.mode()[0] if len(x.mode()) > 0 else 'Unknown'
-    }).reset_index()
+    city_groups = df.groupby('City', observed=True, sort=False)
+    
+    city_stats = city_groups['Depression'].agg(
+        Depression_Count='sum',
+        Total_Students='count',
+        Depression_Rate='mean'
+    )
+    city_stats['Avg_Academic_Pressure'] = city_groups['Academic_Pressure'].mean()
+    
+    # Most common sleep duration from (City, Sleep_Duration) counts instead of a
+    # per-city mode() callback; the stable sort keeps mode()'s tie-breaking
+    sleep_counts = df.groupby(['City', 'Sleep_Duration'], observed=True).size().reset_index(name='Count')
+    most_common_sleep = sleep_counts.sort_values('Count', ascending=False, kind='stable').drop_duplicates('City')
+    city_stats['Most_Common_Sleep'] = most_common_sleep.set_index('City')['Sleep_Duration']
     
-    # Flatten column names
-    city_stats.columns = ['City', 'Depression_Count', 'Total_Students', 
-                          'Depression_Rate', 'Avg_Academic_Pressure', 'Most_Common_Sleep']
+    city_stats = city_stats.reset_index()
     
     # Convert rate to percentage
     city_stats['Depression_Rate'] = city_stats['Depression_Rate'] * 100
@@ -128,6 +247,27 @@ def get_city_stats(df, min_students=1):
     return city_stats
 
 
+def _depression_by(df, column):
+    """
+    Count, total and rate (%) of depressed students per value of a column
+    
+    Args:
+        df: Cleaned DataFrame
+        column: Column to group by
+        
+    Returns:
+        pd.DataFrame: One row per group with Depression_Count, Total and Depression_Rate
+    """
+    grouped = df.groupby(column, observed=True)['Depression'].agg(
+        Depression_Count='sum',
+        Total='count',
+        Depression_Rate='mean'
+    ).reset_index()
+    grouped['Depression_Rate'] = grouped['Depression_Rate'] * 100
+    
+    return grouped
+
+
 def get_demographic_stats(df):
     """
     Calculate depression statistics by demographics (Gender, Degree, etc.)
@@ -138,25 +278,12 @@ def get_demographic_stats(df):
     Returns:
         dict: Dictionary containing demographic statistics
     """
-    stats = {}
-    
-    # Gender statistics
-    if 'Gender' in df.columns:
-        gender_stats = df.groupby('Gender').agg({
-            'Depression': ['sum', 'count', 'mean']
-        }).reset_index()
-        gender_stats.columns = ['Gender', 'Depression_Count', 'Total', 'Depression_Rate']
-        gender_stats['Depression_Rate'] = gender_stats['Depression_Rate'] * 100
-        stats['gender'] = gender_stats
-    
-    # Degree statistics
-    if 'Degree' in df.columns:
-        degree_stats = df.groupby('Degree').agg({
-            'Depression': ['sum', 'count', 'mean']
-        }).reset_index()
-        degree_stats.columns = ['Degree', 'Depression_Count', 'Total', 'Depression_Rate']
-        degree_stats['Depression_Rate'] = degree_stats['Depression_Rate'] * 100
-        stats['degree'] = degree_stats
+    # Columns may have been dropped as constant during cleaning
+    stats = {
+        key: _depression_by(df, column)
+        for key, column in DEMOGRAPHIC_COLUMNS.items()
+        if column in df.columns
+    }
     
     return stats
 
@@ -173,24 +300,55 @@ def get_sleep_stats(df):
         pd.DataFrame: Sleep duration statistics
     """
     # Filter out 'Others' before aggregation
-    df_sleep = df[df['Sleep_Duration'] != 'Others'].copy()
+    df_sleep = df[df['Sleep_Duration'] != 'Others']
     
-    sleep_stats = df_sleep.groupby('Sleep_Duration').agg({
-        'Depression': ['sum', 'count', 'mean']
-    }).reset_index()
+    # Sleep_Duration is an ordered categorical, so the groups come out in order
+    sleep_stats = _depression_by(df_sleep, 'Sleep_Duration')
     
-    sleep_stats.columns = ['Sleep_Duration', 'Depression_Count', 'Total', 'Depression_Rate']
-    sleep_stats['Depression_Rate'] = sleep_stats['Depression_Rate'] * 100
+    return sleep_stats
+
+
+def get_overview_summary(df):
+    """
+    Calculate the headline KPIs shown at the top of the Overview section
     
-    # Order sleep categories logically
-    sleep_order = ['Less than 5 hours', '5-6 hours', '7-8 hours', 'More than 8 hours']
+    Args:
+        df: Cleaned DataFrame
+        
+    Returns:
+        dict: Student counts, depression rate and average scores
+    """
+    total_students = len(df)
+    # Reduce on the underlying arrays to skip pandas dispatch per call
+    depressed_students = int(df['Depression'].to_numpy().sum())
+    
+    summary = {
+        'total_students': total_students,
+        'depressed_students': depressed_students,
+        'not_depressed_students': total_students - depressed_students,
+        'depression_rate': (depressed_students / total_students) * 100,
+        'avg_cgpa': float(df['CGPA'].to_numpy().mean()),
+        'avg_academic_pressure': float(df['Academic_Pressure'].to_numpy().mean())
+    }
     
-    sleep_stats['Sleep_Duration'] = pd.Categorical(
-        sleep_stats['Sleep_Duration'], 
-        categories=sleep_order, 
-        ordered=True
-    )
+    return summary
+
+
+def make_tables(df):
+    """
+    Precompute the aggregate tables used by the Overview section
     
-    sleep_stats = sleep_stats.sort_values('Sleep_Duration')
+    Args:
+        df: Cleaned DataFrame
+        
+    Returns:
+        dict: KPI summary plus city, demographic and sleep statistics
+    """
+    tables = {
+        'summary': get_overview_summary(df),
+        'city': get_city_stats(df, min_students=1),
+        'demographics': get_demographic_stats(df),
+        'sleep': get_sleep_stats(df)
+    }
     
-    return sleep_stats
\ No newline at end of file
+    return tables
\ No newline at end of file
@@ -1,42 +1,49 @@
-import plotly.express as px
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
+import streamlit as st
 
+# Maximum number of bins for numeric histograms
+HISTOGRAM_BINS = 30
+
+@st.cache_resource(show_spinner=False)
 def create_city_map(city_stats):
     """
     Create a bar chart showing depression rates by city
     Only shows cities that meet minimum student threshold
+    Cached per input: the returned figure is shared and must not be modified
     
     Args:
-        city_stats: DataFrame with city statistics (already filtered)
+        city_stats: DataFrame with city statistics (already filtered and
+            sorted by depression rate, highest first, as from get_city_stats)
         
     Returns:
         plotly figure
     """
-    # Sort by depression rate (ascending for horizontal bar chart)
-    city_stats_sorted = city_stats.sort_values('Depression_Rate', ascending=True)
-    
-    fig = px.bar(
-        city_stats_sorted,
-        x='Depression_Rate',
-        y='City',
+    # Reverse the pre-sorted table (ascending for horizontal bar chart) and
+    # hand Plotly plain arrays so it draws the bars in the given order
+    # (float32 is plenty for a percentage and halves the serialized payload)
+    city_stats_sorted = city_stats.iloc[::-1]
+    rates = city_stats_sorted['Depression_Rate'].to_numpy(dtype=np.float32)
+    
+    fig = go.Figure(go.Bar(
+        x=rates,
+        y=city_stats_sorted['City'].to_numpy(),
         orientation='h',
-        title=f'Depression Rate by City ({len(city_stats_sorted)} Cities)',
-        labels={'Depression_Rate': 'Depression Rate (%)', 'City': 'City'},
-        color='Depression_Rate',
-        color_continuous_scale='OrRd',
-        text='Depression_Rate'
-    )
-    
-    fig.update_traces(
-        texttemplate='%{text:.1f}%', 
+        marker=dict(
+            color=rates,
+            colorscale='OrRd',
+            colorbar=dict(title='Depression Rate (%)')
+        ),
+        text=[f'{rate:.1f}%' for rate in rates],
         textposition='outside',
         textfont=dict(size=10, color='black'),
-        hovertemplate='<b>%{y}</b><br>Depression Rate: %{x:.1f}%<br>Students: %{customdata[0]}<extra></extra>',
-        customdata=city_stats_sorted[['Total_Students']]
-    )
+        customdata=city_stats_sorted['Total_Students'].to_numpy(),
+        hovertemplate='<b>%{y}</b><br>Depression Rate: %{x:.1f}%<br>Students: %{customdata}<extra></extra>'
+    ))
     
     fig.update_layout(
+        title=f'Depression Rate by City ({len(city_stats_sorted)} Cities)',
         height=max(600, len(city_stats_sorted) * 25),  # Dynamic height
         showlegend=False,
         xaxis_title="Depression Rate (%)",
@@ -47,9 +54,11 @@ def create_city_map(city_stats):
     return fig
 
 
+@st.cache_resource(show_spinner=False)
 def create_demographic_chart(demo_stats, category='gender'):
     """
     Create bar chart for demographic comparisons
+    Cached per input: the returned figure is shared and must not be modified
     
     Args:
         demo_stats: Dictionary with demographic statistics
@@ -59,38 +68,39 @@ def create_demographic_chart(demo_stats, category='gender'):
         plotly figure
     """
     df = demo_stats[category]
-    
-    fig = px.bar(
-        df,
-        x=category.capitalize(),
-        y='Depression_Rate',
-        title=f'Depression Rate by {category.capitalize()}',
-        labels={'Depression_Rate': 'Depression Rate (%)', category.capitalize(): category.capitalize()},
-        color='Depression_Rate',
-        color_continuous_scale='OrRd',
-        text='Depression_Rate'
-    )
-    
-    fig.update_traces(
-        texttemplate='%{text:.1f}%', 
+    rates = df['Depression_Rate'].to_numpy(dtype=np.float32)
+    
+    fig = go.Figure(go.Bar(
+        x=df[category.capitalize()].to_numpy(),
+        y=rates,
+        marker=dict(
+            color=rates,
+            colorscale='OrRd',
+            colorbar=dict(title='Depression Rate (%)')
+        ),
+        text=[f'{rate:.1f}%' for rate in rates],
         textposition='outside',
-        textfont=dict(size=14, color='black')
-    )
+        textfont=dict(size=14, color='black'),
+        hovertemplate='<b>%{x}</b><br>Depression Rate: %{y:.1f}%<extra></extra>'
+    ))
     
     fig.update_layout(
+        title=f'Depression Rate by {category.capitalize()}',
         showlegend=False,
         xaxis_title=category.capitalize(),
         yaxis_title="Depression Rate (%)",
-        yaxis=dict(range=[0, max(df['Depression_Rate']) * 1.15]),
+        yaxis=dict(range=[0, float(rates.max()) * 1.15]),
         height=500
     )
     
     return fig
 
 
+@st.cache_resource(show_spinner=False)
 def create_sleep_chart(sleep_stats):
     """
     Create chart showing relationship between sleep and depression
+    Cached per input: the returned figure is shared and must not be modified
     
     Args:
         sleep_stats: DataFrame with sleep statistics
@@ -98,28 +108,28 @@ def create_sleep_chart(sleep_stats):
     Returns:
         plotly figure
     """
-    fig = px.bar(
-        sleep_stats,
-        x='Sleep_Duration',
-        y='Depression_Rate',
-        title='Depression Rate by Sleep Duration',
-        labels={'Depression_Rate': 'Depression Rate (%)', 'Sleep_Duration': 'Sleep Duration'},
-        color='Depression_Rate',
-        color_continuous_scale='OrRd',
-        text='Depression_Rate'
-    )
-    
-    fig.update_traces(
-        texttemplate='%{text:.1f}%', 
+    rates = sleep_stats['Depression_Rate'].to_numpy(dtype=np.float32)
+    
+    fig = go.Figure(go.Bar(
+        x=sleep_stats['Sleep_Duration'].to_numpy(),
+        y=rates,
+        marker=dict(
+            color=rates,
+            colorscale='OrRd',
+            colorbar=dict(title='Depression Rate (%)')
+        ),
+        text=[f'{rate:.1f}%' for rate in rates],
         textposition='outside',
-        textfont=dict(size=14, color='black')
-    )
+        textfont=dict(size=14, color='black'),
+        hovertemplate='<b>%{x}</b><br>Depression Rate: %{y:.1f}%<extra></extra>'
+    ))
     
     fig.update_layout(
+        title='Depression Rate by Sleep Duration',
         showlegend=False,
         xaxis_title="Sleep Duration",
         yaxis_title="Depression Rate (%)",
-        yaxis=dict(range=[0, max(sleep_stats['Depression_Rate']) * 1.15]),
+        yaxis=dict(range=[0, float(rates.max()) * 1.15]),
         height=500
     )
     
@@ -136,6 +146,9 @@ def create_correlation_heatmap(df):
     Returns:
         plotly figure
     """
+    # Plotly Express is only needed here, load it on first use
+    import plotly.express as px
+    
     # Select only numeric columns relevant for correlation
     numeric_cols = ['Age', 'Academic_Pressure', 'CGPA', 'Study_Satisfaction', 
                     'Financial_Stress', 'Work_Study_Hours', 'Depression']
@@ -143,7 +156,15 @@ def create_correlation_heatmap(df):
     # Filter to existing columns
     numeric_cols = [col for col in numeric_cols if col in df.columns]
     
-    corr_matrix = df[numeric_cols].corr()
+    # One NumPy call on a float32 block instead of pandas' per-pair loop
+    # (rows with a missing value are skipped, the cleaned data has none)
+    values = df[numeric_cols].to_numpy(dtype=np.float32, na_value=np.nan)
+    values = values[~np.isnan(values).any(axis=1)]
+    corr_matrix = pd.DataFrame(
+        np.corrcoef(values, rowvar=False),
+        index=numeric_cols,
+        columns=numeric_cols
+    )
     
     fig = px.imshow(
         corr_matrix,
@@ -175,18 +196,41 @@ def create_distribution_chart(df, column, title):
     Returns:
         plotly figure
     """
-    fig = px.histogram(
-        df,
-        x=column,
-        color='Depression',
-        title=title,
-        labels={column: column, 'Depression': 'Depression Status'},
-        barmode='overlay',
-        opacity=0.7,
-        color_discrete_map={0: 'lightblue', 1: 'red'}
-    )
+    values = df[column]
+    depression = df['Depression'].to_numpy()
+    
+    # Bin on the server so only bar heights are sent to the browser,
+    # not every raw value
+    if pd.api.types.is_numeric_dtype(values) and values.nunique() > HISTOGRAM_BINS:
+        raw = values.to_numpy()
+        if np.all(np.mod(raw, 1) == 0):
+            # Whole numbers stored as floats (e.g. Age): bins of whole-number
+            # width centred on the values, so no bin spans more ages than another
+            step = int(np.ceil((raw.max() - raw.min() + 1) / HISTOGRAM_BINS))
+            edges = np.arange(raw.min(), raw.max() + step + 1, step) - 0.5
+        else:
+            edges = np.histogram_bin_edges(raw, bins=HISTOGRAM_BINS)
+        x = ((edges[:-1] + edges[1:]) / 2).astype(np.float32)
+        counts = {
+            status: np.histogram(values.to_numpy()[depression == status], bins=edges)[0]
+            for status in (0, 1)
+        }
+    else:
+        # Few distinct values (scores, categories): count each value exactly
+        table = pd.crosstab(values, depression)
+        x = table.index
+        counts = {status: table[status].to_numpy() for status in table.columns}
+    
+    colors = {0: 'lightblue', 1: 'red'}
+    fig = go.Figure([
+        go.Bar(x=x, y=y, name=str(status), marker_color=colors[status], opacity=0.7)
+        for status, y in counts.items()
+    ])
     
     fig.update_layout(
+        title=title,
+        barmode='overlay',
+        bargap=0,
         xaxis_title=column,
         yaxis_title="Count",
         legend_title="Depression"